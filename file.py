@@ -1,992 +1,1625 @@
-#!/usr/bin/env python3
-"""
-File Operations CLI Tool
---------------------------------
-Features:
-- Create, Read, Write, Append files
-- Rename and Delete files/folders
-- Copy & Move files
-- Search files by name, extension, or keyword
-- Compress & Extract (.zip)
-- Organize files by extension into categories
-- Storage Analysis across drives
-- Delete Temporary Files (optional yes/no)
-- Dry-run support (preview actions)
-- Interactive Menu Mode
-- Loading effect for operations
-- Compression suggestion for large files
-- Works across drives (C:, D:, E:, etc.)
-"""
-
-import os
-import sys
-import shutil
-import argparse
-import zipfile
-import platform
-import tempfile
-import time
-import itertools
-from pathlib import Path
-from datetime import datetime
-
-# ------------------- ICON DEFINITIONS ------------------- #
-ICONS = {
-    'create': '📝',
-    'read': '📖',
-    'write': '✍️',
-    'append': '➕',
-    'rename': '✏️',
-    'delete': '🗑️',
-    'copy': '📋',
-    'move': '➡️',
-    'search': '🔍',
-    'compress': '📦',
-    'extract': '📂',
-    'organize': '📁',
-    'storage': '💾',
-    'success': '✔️',
-    'error': '❌',
-    'warning': '⚠️',
-    'info': 'ℹ️',
-    'file': '📄',
-    'folder': '📁',
-    'image': '🖼️',
-    'video': '🎬',
-    'music': '🎵',
-    'document': '📑',
-    'program': '💻',
-    'archive': '📦',
-    'temp': '🗑️',
-}
-
-# ------------------- EXTENSION -> CATEGORY ------------------- #
-EXTENSION_FOLDERS = {
-    '.jpg': 'Images', '.jpeg': 'Images', '.png': 'Images', '.gif': 'Images', '.svg': 'Images',
-    '.webp': 'Images', '.heic': 'Images',
-    '.mp4': 'Videos', '.avi': 'Videos', '.mkv': 'Videos', '.mov': 'Videos', '.wmv': 'Videos',
-    '.pdf': 'Documents', '.doc': 'Documents', '.docx': 'Documents',
-    '.xls': 'Documents', '.xlsx': 'Documents', '.csv': 'Documents',
-    '.ppt': 'Documents', '.pptx': 'Documents', '.txt': 'Documents',
-    '.mp3': 'Music', '.wav': 'Music', '.aac': 'Music', '.flac': 'Music',
-    '.py': 'Programs', '.ipynb': 'Programs', '.c': 'Programs', '.cpp': 'Programs',
-    '.java': 'Programs', '.js': 'Programs', '.ts': 'Programs', '.sh': 'Programs',
-    '.exe': 'Applications', '.msi': 'Applications', '.apk': 'Applications',
-    '.dmg': 'Applications', '.deb': 'Applications', '.rpm': 'Applications',
-    '.zip': 'Compressed', '.rar': 'Compressed', '.7z': 'Compressed',
-    '.tar': 'Compressed', '.gz': 'Compressed'
-}
-
-# ------------------- LOADING BOX ------------------- #
-def loading_effect(message="Processing", duration=2):
-    colors = ["\033[94m", "\033[92m"]  # Blue & Green
-    reset = "\033[0m"
-    spinner = itertools.cycle(["▮", "▯"])
-    t_end = time.time() + duration
-    i = 0
-    while time.time() < t_end:
-        color = colors[i % len(colors)]
-        sys.stdout.write(f"\r{color}{message} {next(spinner)}{reset}")
-        sys.stdout.flush()
-        i += 1
-        time.sleep(0.2)
-    print("\r" + " " * 50)  # Clear the line
-
-# ------------------- FILE OPERATIONS ------------------- #
-def validate_path(path, should_exist=True, path_type='auto'):
-    """
-    Comprehensive path validation
-    Args:
-        path: Path to validate
-        should_exist: Whether path should already exist
-        path_type: 'file', 'dir', or 'auto' for automatic detection
-    """
-    if not path or not isinstance(path, str):
-        return False, f"{ICONS['error']} Invalid path format - path must be a non-empty string"
-    
-    try:
-        path = path.strip()
-        if not path:
-            return False, f"{ICONS['error']} Invalid path - cannot be empty or whitespace only"
-        
-        path_obj = Path(path)
-        
-        # Check for invalid characters in path
-        invalid_chars = ['<', '>', '|', '\0', '\n', '\r']
-        if any(char in str(path_obj) for char in invalid_chars):
-            return False, f"{ICONS['error']} Invalid path - contains illegal characters"
-        
-        if should_exist:
-            if not path_obj.exists():
-                return False, f"{ICONS['error']} Path does not exist: {path}"
-            
-            # Type checking
-            if path_type == 'file' and path_obj.is_dir():
-                return False, f"{ICONS['error']} Expected file but found directory: {path}"
-            elif path_type == 'dir' and path_obj.is_file():
-                return False, f"{ICONS['error']} Expected directory but found file: {path}"
-        else:
-            # For new paths, check if parent directory exists
-            parent = path_obj.parent
-            if not parent.exists():
-                return False, f"{ICONS['error']} Parent directory does not exist: {parent}"
-            
-            # Check if file already exists (for safety)
-            if path_obj.exists() and path_type == 'file':
-                return True, f"{ICONS['warning']} File already exists (will be overwritten)"
-        
-        return True, None
-    except PermissionError:
-        return False, f"{ICONS['error']} Permission denied - insufficient privileges for: {path}"
-    except OSError as e:
-        return False, f"{ICONS['error']} OS error - {str(e)}"
-    except Exception as e:
-        return False, f"{ICONS['error']} Invalid path format: {str(e)}"
-
-def create_file(path):
-    """Create a new file with comprehensive error handling"""
-    valid, error = validate_path(path, should_exist=False, path_type='file')
-    if not valid:
-        print(error)
-        return False
-    
-    try:
-        path_obj = Path(path)
-        
-        # Ensure parent directory exists
-        path_obj.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Create the file
-        path_obj.touch(exist_ok=True)
-        loading_effect("Creating file")
-        print(f"{ICONS['success']} {ICONS['create']} Created file: {path}")
-        return True
-    except PermissionError:
-        print(f"{ICONS['error']} Permission denied - cannot create file in this location")
-        return False
-    except IsADirectoryError:
-        print(f"{ICONS['error']} Path is a directory, not a file: {path}")
-        return False
-    except Exception as e:
-        print(f"{ICONS['error']} Could not create file: {str(e)}")
-        return False
-
-def read_file(path):
-    """Read file contents with comprehensive error handling"""
-    valid, error = validate_path(path, should_exist=True, path_type='file')
-    if not valid:
-        print(error)
-        return False
-    
-    try:
-        if not os.access(path, os.R_OK):
-            print(f"{ICONS['error']} Permission denied - cannot read file: {path}")
-            return False
-        
-        loading_effect("Reading file")
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
-            print(f"\n{ICONS['read']} Content of {path}:")
-            print("─" * 60)
-            print(content if content else "[Empty file]")
-            print("─" * 60)
-        return True
-    except UnicodeDecodeError:
-        print(f"{ICONS['error']} Could not read file - encoding error (not UTF-8)")
-        return False
-    except PermissionError:
-        print(f"{ICONS['error']} Permission denied - cannot read file: {path}")
-        return False
-    except IsADirectoryError:
-        print(f"{ICONS['error']} Path is a directory, not a file: {path}")
-        return False
-    except FileNotFoundError:
-        print(f"{ICONS['error']} File not found: {path}")
-        return False
-    except Exception as e:
-        print(f"{ICONS['error']} Could not read file: {str(e)}")
-        return False
-
-def write_file(path, text, append=False):
-    """Write or append to file with comprehensive error handling"""
-    valid, error = validate_path(path, should_exist=append, path_type='file')
-    if not valid and append:
-        print(error)
-        return False
-    
-    try:
-        if not text or not isinstance(text, str):
-            print(f"{ICONS['warning']} Warning: text input appears invalid, writing empty content")
-        
-        # For new files, ensure parent directory exists
-        if not append:
-            path_obj = Path(path)
-            path_obj.parent.mkdir(parents=True, exist_ok=True)
-        
-        mode = "a" if append else "w"
-        icon = ICONS['append'] if append else ICONS['write']
-        
-        if not os.access(Path(path).parent, os.W_OK):
-            print(f"{ICONS['error']} Permission denied - cannot write to this directory")
-            return False
-        
-        loading_effect("Writing to file")
-        with open(path, mode, encoding="utf-8") as f:
-            f.write(text + "\n")
-        
-        action = "Appended to" if append else "Written to"
-        print(f"{ICONS['success']} {icon} {action}: {path}")
-        check_suggest_compress(path)
-        return True
-    except PermissionError:
-        print(f"{ICONS['error']} Permission denied - cannot write to file")
-        return False
-    except IsADirectoryError:
-        print(f"{ICONS['error']} Path is a directory, not a file: {path}")
-        return False
-    except IOError as e:
-        print(f"{ICONS['error']} I/O error - could not write to file: {str(e)}")
-        return False
-    except Exception as e:
-        print(f"{ICONS['error']} Could not write to file: {str(e)}")
-        return False
-
-def rename_item(src, dst):
-    """Rename file or directory with comprehensive error handling"""
-    valid_src, error_src = validate_path(src, should_exist=True)
-    if not valid_src:
-        print(error_src)
-        return False
-    
-    if not dst or not isinstance(dst, str):
-        print(f"{ICONS['error']} Destination path cannot be empty")
-        return False
-    
-    dst = dst.strip()
-    
-    try:
-        if Path(dst).exists():
-            print(f"{ICONS['error']} Destination already exists: {dst}")
-            return False
-        
-        # Check write permission on parent directory
-        if not os.access(Path(dst).parent, os.W_OK):
-            print(f"{ICONS['error']} Permission denied - cannot write to destination directory")
-            return False
-        
-        loading_effect("Renaming")
-        os.rename(src, dst)
-        print(f"{ICONS['success']} {ICONS['rename']} Renamed: {src} → {dst}")
-        return True
-    except PermissionError:
-        print(f"{ICONS['error']} Permission denied - cannot rename item")
-        return False
-    except FileExistsError:
-        print(f"{ICONS['error']} Destination already exists")
-        return False
-    except OSError as e:
-        print(f"{ICONS['error']} OS error during rename: {str(e)}")
-        return False
-    except Exception as e:
-        print(f"{ICONS['error']} Could not rename {src}: {e}")
-        return False
-
-def delete_item(path):
-    """Delete file or directory with comprehensive error handling"""
-    valid, error = validate_path(path, should_exist=True)
-    if not valid:
-        print(error)
-        return False
-    
-    try:
-        # Check if we have permission
-        if not os.access(path, os.W_OK):
-            print(f"{ICONS['error']} Permission denied - cannot delete: {path}")
-            return False
-        
-        loading_effect("Deleting")
-        if os.path.isdir(path):
-            # Check if directory is not empty
-            if os.listdir(path) and not os.access(path, os.R_OK | os.W_OK | os.X_OK):
-                print(f"{ICONS['error']} Permission denied - cannot delete non-empty directory")
-                return False
-            shutil.rmtree(path)
-        else:
-            os.remove(path)
-        print(f"{ICONS['success']} {ICONS['delete']} Deleted: {path}")
-        return True
-    except PermissionError:
-        print(f"{ICONS['error']} Permission denied - cannot delete item")
-        return False
-    except OSError as e:
-        print(f"{ICONS['error']} OS error during delete: {str(e)}")
-        return False
-    except Exception as e:
-        print(f"{ICONS['error']} Could not delete {path}: {str(e)}")
-        return False
-
-def copy_item(src, dst):
-    """Copy file or directory with comprehensive error handling"""
-    valid_src, error_src = validate_path(src, should_exist=True)
-    if not valid_src:
-        print(error_src)
-        return False
-    
-    if not dst or not isinstance(dst, str):
-        print(f"{ICONS['error']} Destination path cannot be empty")
-        return False
-    
-    dst = dst.strip()
-    
-    try:
-        # Check source readability
-        if not os.access(src, os.R_OK):
-            print(f"{ICONS['error']} Permission denied - cannot read source: {src}")
-            return False
-        
-        # Create parent directory if needed
-        dst_parent = Path(dst).parent
-        if not dst_parent.exists():
-            dst_parent.mkdir(parents=True, exist_ok=True)
-        
-        # Check destination write permission
-        if not os.access(dst_parent, os.W_OK):
-            print(f"{ICONS['error']} Permission denied - cannot write to destination")
-            return False
-        
-        loading_effect("Copying")
-        if os.path.isdir(src):
-            if os.path.exists(dst):
-                print(f"{ICONS['warning']} Destination exists, merging contents")
-            shutil.copytree(src, dst, dirs_exist_ok=True)
-        else:
-            shutil.copy2(src, dst)
-        print(f"{ICONS['success']} {ICONS['copy']} Copied: {src} → {dst}")
-        check_suggest_compress(dst)
-        return True
-    except PermissionError:
-        print(f"{ICONS['error']} Permission denied - cannot copy item")
-        return False
-    except FileNotFoundError:
-        print(f"{ICONS['error']} Source file not found: {src}")
-        return False
-    except IsADirectoryError:
-        print(f"{ICONS['error']} Destination is a directory, not a file")
-        return False
-    except OSError as e:
-        print(f"{ICONS['error']} OS error during copy: {str(e)}")
-        return False
-    except Exception as e:
-        print(f"{ICONS['error']} Could not copy {src}: {str(e)}")
-        return False
-
-def move_item(src, dst):
-    """Move file or directory with comprehensive error handling"""
-    valid_src, error_src = validate_path(src, should_exist=True)
-    if not valid_src:
-        print(error_src)
-        return False
-    
-    if not dst or not isinstance(dst, str):
-        print(f"{ICONS['error']} Destination path cannot be empty")
-        return False
-    
-    dst = dst.strip()
-    
-    try:
-        # Check permissions
-        if not os.access(src, os.W_OK):
-            print(f"{ICONS['error']} Permission denied - cannot move source")
-            return False
-        
-        # Create parent directory if needed
-        dst_parent = Path(dst).parent
-        if not dst_parent.exists():
-            dst_parent.mkdir(parents=True, exist_ok=True)
-        
-        if not os.access(dst_parent, os.W_OK):
-            print(f"{ICONS['error']} Permission denied - cannot write to destination")
-            return False
-        
-        loading_effect("Moving")
-        shutil.move(src, dst)
-        print(f"{ICONS['success']} {ICONS['move']} Moved: {src} → {dst}")
-        check_suggest_compress(dst)
-        return True
-    except PermissionError:
-        print(f"{ICONS['error']} Permission denied - cannot move item")
-        return False
-    except FileNotFoundError:
-        print(f"{ICONS['error']} Source not found: {src}")
-        return False
-    except OSError as e:
-        print(f"{ICONS['error']} OS error during move: {str(e)}")
-        return False
-    except Exception as e:
-        print(f"{ICONS['error']} Could not move {src}: {str(e)}")
-        return False
-
-def search_files(directory, name=None, ext=None, keyword=None):
-    """Search files with comprehensive error handling"""
-    valid, error = validate_path(directory, should_exist=True, path_type='dir')
-    if not valid:
-        print(error)
-        return False
-
-    try:
-        if not os.access(directory, os.R_OK):
-            print(f"{ICONS['error']} Permission denied - cannot read directory: {directory}")
-            return False
-        
-        loading_effect("Searching files")
-        found_files = False
-        search_count = 0
-        
-        for root, _, files in os.walk(directory):
-            # Check if we can read this directory
-            if not os.access(root, os.R_OK):
-                print(f"{ICONS['warning']} Skipped (permission denied): {root}")
-                continue
-            
-            for file in files:
-                try:
-                    if name and name.lower() not in file.lower():
-                        continue
-                    if ext and not file.lower().endswith(ext.lower()):
-                        continue
-                    if keyword:
-                        try:
-                            file_path = os.path.join(root, file)
-                            if not os.access(file_path, os.R_OK):
-                                continue
-                            with open(file_path, "r", errors="ignore", encoding="utf-8") as f:
-                                if keyword.lower() not in f.read().lower():
-                                    continue
-                        except (PermissionError, IOError):
-                            continue
-                    
-                    file_path = os.path.join(root, file)
-                    print(f"{ICONS['search']} {file_path}")
-                    found_files = True
-                    search_count += 1
-                except Exception:
-                    continue
-        
-        if not found_files:
-            print(f"{ICONS['info']} No matching files found")
-        else:
-            print(f"{ICONS['info']} Found {search_count} matching file(s)")
-        return True
-    except PermissionError:
-        print(f"{ICONS['error']} Permission denied - cannot access directory")
-        return False
-    except FileNotFoundError:
-        print(f"{ICONS['error']} Directory not found: {directory}")
-        return False
-    except Exception as e:
-        print(f"{ICONS['error']} Error during search: {str(e)}")
-        return False
-
-def compress_files(src, dst):
-    """Compress files with comprehensive error handling"""
-    valid_src, error_src = validate_path(src, should_exist=True)
-    if not valid_src:
-        print(error_src)
-        return False
-    
-    if not dst or not isinstance(dst, str):
-        print(f"{ICONS['error']} Destination path cannot be empty")
-        return False
-    
-    dst = dst.strip()
-    if not dst.lower().endswith('.zip'):
-        print(f"{ICONS['warning']} Adding .zip extension to destination")
-        dst += '.zip'
-    
-    try:
-        # Check source readability
-        if not os.access(src, os.R_OK):
-            print(f"{ICONS['error']} Permission denied - cannot read source")
-            return False
-        
-        # Create parent directory and check write permission
-        dst_parent = Path(dst).parent
-        if not dst_parent.exists():
-            dst_parent.mkdir(parents=True, exist_ok=True)
-        
-        if not os.access(dst_parent, os.W_OK):
-            print(f"{ICONS['error']} Permission denied - cannot write to destination directory")
-            return False
-        
-        # Check if destination already exists
-        if os.path.exists(dst):
-            print(f"{ICONS['warning']} Archive already exists, will be overwritten: {dst}")
-        
-        loading_effect("Compressing")
-        file_count = 0
-        
-        with zipfile.ZipFile(dst, "w", zipfile.ZIP_DEFLATED) as zf:
-            if os.path.isdir(src):
-                for root, _, files in os.walk(src):
-                    if not os.access(root, os.R_OK):
-                        print(f"{ICONS['warning']} Skipped (no permission): {root}")
-                        continue
-                    for file in files:
-                        try:
-                            fpath = os.path.join(root, file)
-                            if os.access(fpath, os.R_OK):
-                                zf.write(fpath, os.path.relpath(fpath, src))
-                                file_count += 1
-                        except (PermissionError, IOError):
-                            continue
-                
-                if file_count == 0:
-                    print(f"{ICONS['warning']} Source directory is empty or all files are inaccessible")
-                    return False
-            else:
-                zf.write(src, os.path.basename(src))
-                file_count = 1
-        
-        print(f"{ICONS['success']} {ICONS['compress']} Compressed {file_count} file(s): {src} → {dst}")
-        return True
-    except PermissionError:
-        print(f"{ICONS['error']} Permission denied - cannot create archive")
-        return False
-    except FileNotFoundError:
-        print(f"{ICONS['error']} Source not found: {src}")
-        return False
-    except zipfile.BadZipFile:
-        print(f"{ICONS['error']} Failed to create valid ZIP file")
-        return False
-    except OSError as e:
-        print(f"{ICONS['error']} OS error during compression: {str(e)}")
-        return False
-    except Exception as e:
-        print(f"{ICONS['error']} Could not compress {src}: {str(e)}")
-        return False
-
-def extract_zip(src, dst):
-    """Extract ZIP file with comprehensive error handling"""
-    valid_src, error_src = validate_path(src, should_exist=True, path_type='file')
-    if not valid_src:
-        print(error_src)
-        return False
-    
-    if not src.lower().endswith('.zip'):
-        print(f"{ICONS['error']} Source file is not a ZIP archive: {src}")
-        return False
-    
-    if not dst or not isinstance(dst, str):
-        print(f"{ICONS['error']} Destination path cannot be empty")
-        return False
-    
-    dst = dst.strip()
-
-    try:
-        # Check source readability
-        if not os.access(src, os.R_OK):
-            print(f"{ICONS['error']} Permission denied - cannot read ZIP file")
-            return False
-        
-        # Create destination directory
-        dst_path = Path(dst)
-        if not dst_path.exists():
-            dst_path.mkdir(parents=True, exist_ok=True)
-        
-        # Check write permission on destination
-        if not os.access(dst, os.W_OK):
-            print(f"{ICONS['error']} Permission denied - cannot write to destination")
-            return False
-        
-        loading_effect("Extracting")
-        
-        # Validate and extract ZIP file
-        try:
-            with zipfile.ZipFile(src, "r") as zf:
-                # Test ZIP integrity
-                test_result = zf.testzip()
-                if test_result is not None:
-                    print(f"{ICONS['error']} ZIP file is corrupted, first bad file: {test_result}")
-                    return False
-                
-                # Extract files
-                file_count = len(zf.namelist())
-                zf.extractall(dst)
-                
-        except zipfile.BadZipFile:
-            print(f"{ICONS['error']} Invalid or corrupted ZIP file: {src}")
-            return False
-        except zipfile.LargeZipFile:
-            print(f"{ICONS['error']} ZIP file is too large")
-            return False
-        
-        print(f"{ICONS['success']} {ICONS['extract']} Extracted {file_count} file(s): {src} → {dst}")
-        return True
-    except PermissionError:
-        print(f"{ICONS['error']} Permission denied - cannot extract archive")
-        return False
-    except FileNotFoundError:
-        print(f"{ICONS['error']} ZIP file not found: {src}")
-        return False
-    except IsADirectoryError:
-        print(f"{ICONS['error']} Source is a directory, not a ZIP file")
-        return False
-    except OSError as e:
-        print(f"{ICONS['error']} OS error during extraction: {str(e)}")
-        return False
-    except Exception as e:
-        print(f"{ICONS['error']} Could not extract {src}: {str(e)}")
-        return False
-
-def organize_files(folder, dry_run=False, compress=False, compress_path=None):
-    """Organize files with comprehensive error handling"""
-    if not folder or not isinstance(folder, str):
-        print(f"{ICONS['error']} Folder path cannot be empty")
-        return False
-    
-    folder = folder.strip()
-    folder_path = Path(folder)
-    
-    try:
-        if not folder_path.exists():
-            print(f"{ICONS['error']} Folder does not exist: {folder}")
-            return False
-        
-        if not folder_path.is_dir():
-            print(f"{ICONS['error']} Path is not a directory: {folder}")
-            return False
-        
-        if not os.access(folder, os.R_OK | os.W_OK):
-            print(f"{ICONS['error']} Permission denied - cannot access folder")
-            return False
-        
-        processed = []
-        print(f"\n{ICONS['organize']} Organizing files by type...\n")
-        
-        for file in folder_path.iterdir():
-            try:
-                if file.is_file():
-                    if not os.access(file, os.R_OK | os.W_OK):
-                        print(f"{ICONS['warning']} Skipped (no permission): {file.name}")
-                        continue
-                    
-                    ext = file.suffix.lower()
-                    category = EXTENSION_FOLDERS.get(ext, "Misc")
-                    target_dir = folder_path / category
-                    
-                    try:
-                        target_dir.mkdir(exist_ok=True)
-                    except PermissionError:
-                        print(f"{ICONS['error']} Cannot create directory: {category}")
-                        continue
-
-                    new_path = target_dir / file.name
-                    if dry_run:
-                        print(f"{ICONS['info']} [Dry-run] {file.name} → {category}/")
-                    else:
-                        try:
-                            shutil.move(str(file), str(new_path))
-                            processed.append(new_path)
-                            print(f"{ICONS['success']} {ICONS['file']} {file.name} → {category}/")
-                            check_suggest_compress(new_path)
-                        except (PermissionError, shutil.Error) as e:
-                            print(f"{ICONS['error']} Could not move {file.name}: {str(e)}")
-                            continue
-            except (PermissionError, OSError) as e:
-                print(f"{ICONS['warning']} Skipped: {str(e)}")
-                continue
-
-        if compress and processed:
-            zip_dir = Path(compress_path) if compress_path else folder_path / "Compressed"
-            try:
-                zip_dir.mkdir(exist_ok=True)
-                zip_name = f"archive_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
-                zip_path = zip_dir / zip_name
-                with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                    for file in processed:
-                        zf.write(file, file.name)
-                print(f"\n{ICONS['success']} {ICONS['compress']} Compressed {len(processed)} files into {zip_path}")
-            except PermissionError:
-                print(f"{ICONS['error']} Permission denied - cannot create archive")
-            except Exception as e:
-                print(f"{ICONS['error']} Error creating archive: {str(e)}")
-        
-        return True
-    except PermissionError:
-        print(f"{ICONS['error']} Permission denied - cannot access folder")
-        return False
-    except FileNotFoundError:
-        print(f"{ICONS['error']} Folder not found: {folder}")
-        return False
-    except Exception as e:
-        print(f"{ICONS['error']} Could not organize folder: {str(e)}")
-        return False
-    if not folder.exists():
-        print(f"{ICONS['error']} Folder does not exist.")
-        return False
-
-    try:
-        processed = []
-        print(f"\n{ICONS['organize']} Organizing files by type...\n")
-        
-        for file in folder.iterdir():
-            if file.is_file():
-                ext = file.suffix.lower()
-                category = EXTENSION_FOLDERS.get(ext, "Misc")
-                target_dir = folder / category
-                target_dir.mkdir(exist_ok=True)
-
-                new_path = target_dir / file.name
-                if dry_run:
-                    print(f"{ICONS['info']} [Dry-run] {file.name} → {category}/")
-                else:
-                    shutil.move(str(file), str(new_path))
-                    processed.append(new_path)
-                    print(f"{ICONS['success']} {ICONS['file']} {file.name} → {category}/")
-                    check_suggest_compress(new_path)
-
-        if compress and processed:
-            zip_dir = Path(compress_path) if compress_path else folder / "Compressed"
-            zip_dir.mkdir(exist_ok=True)
-            zip_name = f"archive_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
-            zip_path = zip_dir / zip_name
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                for file in processed:
-                    zf.write(file, file.name)
-            print(f"\n{ICONS['success']} {ICONS['compress']} Compressed {len(processed)} files into {zip_path}")
-        
-        return True
-    except Exception as e:
-        print(f"{ICONS['error']} Could not organize folder: {e}")
-        return False
-
-# ------------------- STORAGE ANALYSIS ------------------- #
-def storage_analysis():
-    print(f"\n{ICONS['storage']} === Storage Analysis ===\n")
-    system = platform.system()
-
-    drives = []
-    if system == "Windows":
-        from string import ascii_uppercase
-        drives = [f"{d}:/" for d in ascii_uppercase if os.path.exists(f"{d}:/")]
-    else:
-        drives = ["/"]
-
-    print(f"{ICONS['info']} Scanning drives...\n")
-    for d in drives:
-        try:
-            usage = shutil.disk_usage(d)
-            total = usage.total // (1024**3)
-            used = usage.used // (1024**3)
-            free = usage.free // (1024**3)
-            usage_percent = (used / total * 100) if total > 0 else 0
-            bar = "█" * int(usage_percent / 5) + "░" * (20 - int(usage_percent / 5))
-            print(f"{ICONS['folder']} Drive {d:<4} │ [{bar}] {usage_percent:>5.1f}% │ {used:>4}/{total:>4} GB")
-        except Exception as e:
-            print(f"{ICONS['error']} Could not access {d}: {e}")
-
-    temp_dir = tempfile.gettempdir()
-    print(f"\n{ICONS['temp']} Temporary files location: {temp_dir}")
-    choice = input(f"{ICONS['info']} Delete all temporary files? (yes/no): ").strip().lower()
-    if choice == "yes":
-        loading_effect("Cleaning temp files")
-        try:
-            deleted_count = 0
-            for root, dirs, files in os.walk(temp_dir):
-                for f in files:
-                    try:
-                        os.remove(os.path.join(root, f))
-                        deleted_count += 1
-                    except:
-                        pass
-                for d in dirs:
-                    try:
-                        shutil.rmtree(os.path.join(root, d), ignore_errors=True)
-                    except:
-                        pass
-            print(f"{ICONS['success']} {ICONS['temp']} Cleaned {deleted_count} temporary items")
-        except Exception as e:
-            print(f"{ICONS['error']} Could not delete temp files: {e}")
-    else:
-        print(f"{ICONS['info']} Temp files not deleted.")
-
-# ------------------- SUGGEST COMPRESSION ------------------- #
-def check_suggest_compress(path, threshold_mb=50):
-    """Suggest compressing file if larger than threshold"""
-    try:
-        if os.path.isfile(path):
-            size_mb = os.path.getsize(path) / (1024 * 1024)
-            if size_mb > threshold_mb:
-                print(f"{ICONS['warning']} {ICONS['compress']} File {path} is {size_mb:.1f} MB. Consider compressing it!")
-    except Exception:
-        pass
-
-# ------------------- INTERACTIVE MENU ------------------- #
-def menu_mode():
-    while True:
-        print("\n" + "=" * 60)
-        print(f"{ICONS['file']} File Operations Menu")
-        print("=" * 60)
-        print(f"{ICONS['create']}  1) Create File")
-        print(f"{ICONS['read']}  2) Read File")
-        print(f"{ICONS['write']}  3) Write File")
-        print(f"{ICONS['append']}  4) Append File")
-        print(f"{ICONS['rename']}  5) Rename File/Folder")
-        print(f"{ICONS['delete']}  6) Delete File/Folder")
-        print(f"{ICONS['copy']}  7) Copy File/Folder")
-        print(f"{ICONS['move']}  8) Move File/Folder")
-        print(f"{ICONS['search']}  9) Search Files")
-        print(f"{ICONS['compress']} 10) Compress")
-        print(f"{ICONS['extract']} 11) Extract")
-        print(f"{ICONS['organize']} 12) Organize Folder")
-        print(f"{ICONS['storage']} 13) Storage Analysis & Temp Cleanup")
-        print(f"🚪 0) Exit")
-        print("=" * 60)
-        
-        try:
-            choice = input(f"{ICONS['info']} Choose option: ").strip()
-
-            if choice == "1":
-                path = input(f"{ICONS['create']} Enter file path: ").strip()
-                if path:
-                    create_file(path)
-                else:
-                    print(f"{ICONS['error']} File path cannot be empty")
-            elif choice == "2":
-                path = input(f"{ICONS['read']} Enter file path: ").strip()
-                if path:
-                    read_file(path)
-                else:
-                    print(f"{ICONS['error']} File path cannot be empty")
-            elif choice == "3":
-                path = input(f"{ICONS['write']} Enter file path: ").strip()
-                if path:
-                    text = input(f"{ICONS['write']} Enter text: ")
-                    write_file(path, text, append=False)
-                else:
-                    print(f"{ICONS['error']} File path cannot be empty")
-            elif choice == "4":
-                path = input(f"{ICONS['append']} Enter file path: ").strip()
-                if path:
-                    text = input(f"{ICONS['append']} Enter text: ")
-                    write_file(path, text, append=True)
-                else:
-                    print(f"{ICONS['error']} File path cannot be empty")
-            elif choice == "5":
-                src = input(f"{ICONS['rename']} Enter source path: ").strip()
-                dst = input(f"{ICONS['rename']} Enter destination path: ").strip()
-                if src and dst:
-                    rename_item(src, dst)
-                else:
-                    print(f"{ICONS['error']} Both source and destination paths are required")
-            elif choice == "6":
-                path = input(f"{ICONS['delete']} Enter path: ").strip()
-                if path:
-                    if input(f"{ICONS['warning']} Are you sure? (yes/no): ").lower() == 'yes':
-                        delete_item(path)
-                    else:
-                        print(f"{ICONS['info']} Delete cancelled")
-                else:
-                    print(f"{ICONS['error']} Path cannot be empty")
-            elif choice == "7":
-                src = input(f"{ICONS['copy']} Enter source path: ").strip()
-                dst = input(f"{ICONS['copy']} Enter destination path: ").strip()
-                if src and dst:
-                    copy_item(src, dst)
-                else:
-                    print(f"{ICONS['error']} Both source and destination paths are required")
-            elif choice == "8":
-                src = input(f"{ICONS['move']} Enter source path: ").strip()
-                dst = input(f"{ICONS['move']} Enter destination path: ").strip()
-                if src and dst:
-                    move_item(src, dst)
-                else:
-                    print(f"{ICONS['error']} Both source and destination paths are required")
-            elif choice == "9":
-                directory = input(f"{ICONS['search']} Enter directory: ").strip()
-                if directory:
-                    search_files(
-                        directory,
-                        name=input(f"{ICONS['search']} Name (optional): ").strip() or None,
-                        ext=input(f"{ICONS['search']} Extension (optional, e.g. .txt): ").strip() or None,
-                        keyword=input(f"{ICONS['search']} Keyword (optional): ").strip() or None
-                    )
-                else:
-                    print(f"{ICONS['error']} Directory path cannot be empty")
-            elif choice == "10":
-                src = input(f"{ICONS['compress']} Enter source path: ").strip()
-                dst = input(f"{ICONS['compress']} Enter destination .zip path: ").strip()
-                if src and dst:
-                    if not dst.lower().endswith('.zip'):
-                        dst += '.zip'
-                    compress_files(src, dst)
-                else:
-                    print(f"{ICONS['error']} Both source and destination paths are required")
-            elif choice == "11":
-                src = input(f"{ICONS['extract']} Enter .zip path: ").strip()
-                dst = input(f"{ICONS['extract']} Enter destination folder: ").strip()
-                if src and dst:
-                    extract_zip(src, dst)
-                else:
-                    print(f"{ICONS['error']} Both source and destination paths are required")
-            elif choice == "12":
-                path = input(f"{ICONS['organize']} Enter folder path: ").strip()
-                if path:
-                    organize_files(path)
-                else:
-                    print(f"{ICONS['error']} Folder path cannot be empty")
-            elif choice == "13":
-                storage_analysis()
-            elif choice == "0":
-                print(f"\n{ICONS['success']} Goodbye 👋\n")
-                break
-            else:
-                print(f"{ICONS['error']} Invalid choice.")
-                
-        except KeyboardInterrupt:
-            print(f"\n{ICONS['info']} Operation cancelled")
-            continue
-        except Exception as e:
-            print(f"{ICONS['error']} An error occurred: {str(e)}")
-            continue
-        
-        input(f"\n{ICONS['info']} Press Enter to continue...")
-
-# ------------------- CLI ------------------- #
-def main():
-    parser = argparse.ArgumentParser(description="File Operations CLI Tool")
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    # menu
-    subparsers.add_parser("menu", help="Run interactive menu")
-
-    # storage
-    subparsers.add_parser("storage", help="Run storage analysis and temp cleanup")
-
-    # compress
-    sp_compress = subparsers.add_parser("compress", help="Compress files/folders")
-    sp_compress.add_argument("src")
-    sp_compress.add_argument("dst")
-
-    # extract
-    sp_extract = subparsers.add_parser("extract", help="Extract zip file")
-    sp_extract.add_argument("src")
-    sp_extract.add_argument("dst")
-
-    args = parser.parse_args()
-
-    if args.command == "menu":
-        menu_mode()
-    elif args.command == "storage":
-        storage_analysis()
-    elif args.command == "compress":
-        compress_files(args.src, args.dst)
-    elif args.command == "extract":
-        extract_zip(args.src, args.dst)
-
-if __name__ == "__main__":
-    try:
-        main()
-    except KeyboardInterrupt:
-        print(f"\n{ICONS['info']} Cancelled by user.")
+#!/usr/bin/env python3
+"""
+File Operations CLI Tool
+--------------------------------
+Features:
+- Create, Read, Write, Append files
+- Rename and Delete files/folders
+- Copy & Move files
+- Search files by name, extension, or keyword
+- Compress & Extract (.zip)
+- Organize files by extension into categories
+- Storage Analysis across drives
+- Delete Temporary Files (optional yes/no)
+- Dry-run support (preview actions)
+- Interactive Menu Mode
+- Loading spinner for operations
+- Compression suggestion for large files
+- Works across drives (C:, D:, E:, etc.)
+"""
+
+import os
+import re
+import stat
+import errno
+import heapq
+import sys
+import mmap
+import codecs
+import platform
+import time
+import itertools
+import functools
+import threading
+from pathlib import Path
+
+try:
+    import liburing  # Optional: batched io_uring unlinks for temp cleanup on Linux
+except ImportError:
+    liburing = None
+
+# ------------------- ICON DEFINITIONS ------------------- #
+ICONS = {
+    'create': '📝',
+    'read': '📖',
+    'write': '✍️',
+    'append': '➕',
+    'rename': '✏️',
+    'delete': '🗑️',
+    'copy': '📋',
+    'move': '➡️',
+    'search': '🔍',
+    'compress': '📦',
+    'extract': '📂',
+    'organize': '📁',
+    'storage': '💾',
+    'success': '✔️',
+    'error': '❌',
+    'warning': '⚠️',
+    'info': 'ℹ️',
+    'file': '📄',
+    'folder': '📁',
+    'image': '🖼️',
+    'video': '🎬',
+    'music': '🎵',
+    'document': '📑',
+    'program': '💻',
+    'archive': '📦',
+    'temp': '🗑️',
+}
+
+# Status icons used on nearly every output line, resolved once
+_SUCCESS = ICONS['success']
+_ERROR = ICONS['error']
+_WARNING = ICONS['warning']
+_INFO = ICONS['info']
+
+# ------------------- PLATFORM ------------------- #
+_SYSTEM = platform.system()
+_NCPU = os.cpu_count() or 1
+_DRIVE_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# ------------------- EXTENSION -> CATEGORY ------------------- #
+EXTENSION_FOLDERS = {
+    '.jpg': 'Images', '.jpeg': 'Images', '.png': 'Images', '.gif': 'Images', '.svg': 'Images',
+    '.webp': 'Images', '.heic': 'Images',
+    '.mp4': 'Videos', '.avi': 'Videos', '.mkv': 'Videos', '.mov': 'Videos', '.wmv': 'Videos',
+    '.pdf': 'Documents', '.doc': 'Documents', '.docx': 'Documents',
+    '.xls': 'Documents', '.xlsx': 'Documents', '.csv': 'Documents',
+    '.ppt': 'Documents', '.pptx': 'Documents', '.txt': 'Documents',
+    '.mp3': 'Music', '.wav': 'Music', '.aac': 'Music', '.flac': 'Music',
+    '.py': 'Programs', '.ipynb': 'Programs', '.c': 'Programs', '.cpp': 'Programs',
+    '.java': 'Programs', '.js': 'Programs', '.ts': 'Programs', '.sh': 'Programs',
+    '.exe': 'Applications', '.msi': 'Applications', '.apk': 'Applications',
+    '.dmg': 'Applications', '.deb': 'Applications', '.rpm': 'Applications',
+    '.zip': 'Compressed', '.rar': 'Compressed', '.7z': 'Compressed',
+    '.tar': 'Compressed', '.gz': 'Compressed'
+}
+
+# Already-compressed formats gain nothing from deflate, so they are stored as-is
+STORED_EXTS = {
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic',
+    '.mp4', '.mkv', '.mov', '.avi', '.wmv',
+    '.mp3', '.aac', '.flac',
+    '.zip', '.7z', '.rar', '.gz', '.docx', '.xlsx', '.pptx', '.apk',
+}
+
+def _extension(filename):
+    """Return the lowercased extension of a file name without building a Path"""
+    stem, dot, ext = filename.rpartition('.')
+    if not stem:  # No extension, or a dotfile like .bashrc
+        return ''
+    return dot + ext.lower()
+
+def _category_for(filename):
+    """Map a file name to its category folder"""
+    return EXTENSION_FOLDERS.get(_extension(filename), "Misc")
+
+def _zip_write(zf, path, arcname):
+    """Add a file to an archive, storing incompressible media and using fast deflate otherwise"""
+    import zipfile
+    if _extension(os.path.basename(path)) in STORED_EXTS:
+        zf.write(path, arcname, compress_type=zipfile.ZIP_STORED)
+    else:
+        zf.write(path, arcname, compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+
+# ------------------- LOADING BOX ------------------- #
+class Spinner:
+    """Animate a spinner on a background thread while the wrapped block runs"""
+    colors = ["\033[94m", "\033[92m"]  # Blue & Green
+    reset = "\033[0m"
+
+    def __init__(self, message="Processing", interval=0.2):
+        self.message = message
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _spin(self):
+        spinner = itertools.cycle(["▮", "▯"])
+        i = 0
+        while not self._stop.is_set():
+            color = self.colors[i % len(self.colors)]
+            sys.stdout.write(f"\r{color}{self.message} {next(spinner)}{self.reset}")
+            sys.stdout.flush()
+            i += 1
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._spin, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+        sys.stdout.write("\r" + " " * 50 + "\r")  # Clear the line
+        sys.stdout.flush()
+        return False
+
+# ------------------- FILE OPERATIONS ------------------- #
+def _ensure_dir(p, made=None):
+    """Create directory p (and parents) unless it exists, skipping paths already in `made`"""
+    s = os.path.abspath(p)
+    if made is not None and s in made:
+        return
+    if not os.path.isdir(s):
+        os.makedirs(s, exist_ok=True)
+    if made is not None:
+        made.add(s)
+
+_BAD_CHARS = frozenset('<>|\0\n\r')  # Characters rejected anywhere in a path
+
+def validate_path(path, should_exist=True, path_type='auto'):
+    """
+    Comprehensive path validation
+    Args:
+        path: Path to validate
+        should_exist: Whether path should already exist
+        path_type: 'file', 'dir', or 'auto' for automatic detection
+    Returns:
+        (valid, error, st) where st is the path's os.stat_result, or None if it does not exist
+    """
+    if not path or not isinstance(path, str):
+        return False, f"{_ERROR} Invalid path format - path must be a non-empty string", None
+    
+    try:
+        path = path.strip()
+        if not path:
+            return False, f"{_ERROR} Invalid path - cannot be empty or whitespace only", None
+        
+        # Check for invalid characters in path
+        if not _BAD_CHARS.isdisjoint(path):
+            return False, f"{_ERROR} Invalid path - contains illegal characters", None
+        
+        # A single stat answers existence and type
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            st = None
+        
+        if should_exist:
+            if st is None:
+                return False, f"{_ERROR} Path does not exist: {path}", None
+            
+            # Type checking
+            if path_type == 'file' and stat.S_ISDIR(st.st_mode):
+                return False, f"{_ERROR} Expected file but found directory: {path}", st
+            elif path_type == 'dir' and stat.S_ISREG(st.st_mode):
+                return False, f"{_ERROR} Expected directory but found file: {path}", st
+        elif st is None:
+            # For new paths, check if parent directory exists
+            parent = Path(path).parent
+            if not parent.exists():
+                return False, f"{_ERROR} Parent directory does not exist: {parent}", None
+        elif path_type == 'file':
+            # File already exists (for safety)
+            return True, f"{_WARNING} File already exists (will be overwritten)", st
+        
+        return True, None, st
+    except PermissionError:
+        return False, f"{_ERROR} Permission denied - insufficient privileges for: {path}", None
+    except OSError as e:
+        return False, f"{_ERROR} OS error - {str(e)}", None
+    except Exception as e:
+        return False, f"{_ERROR} Invalid path format: {str(e)}", None
+
+def create_file(path):
+    """Create a new file with comprehensive error handling"""
+    valid, error, _ = validate_path(path, should_exist=False, path_type='file')
+    if not valid:
+        print(error)
+        return False
+    
+    try:
+        path_obj = Path(path)
+        
+        # Ensure parent directory exists
+        _ensure_dir(path_obj.parent)
+        
+        # Create the file
+        with Spinner("Creating file"):
+            path_obj.touch(exist_ok=True)
+        print(f"{_SUCCESS} {ICONS['create']} Created file: {path}")
+        return True
+    except PermissionError:
+        print(f"{_ERROR} Permission denied - cannot create file in this location")
+        return False
+    except IsADirectoryError:
+        print(f"{_ERROR} Path is a directory, not a file: {path}")
+        return False
+    except Exception as e:
+        print(f"{_ERROR} Could not create file: {str(e)}")
+        return False
+
+def read_file(path):
+    """Read file contents with comprehensive error handling"""
+    valid, error, _ = validate_path(path, should_exist=True, path_type='file')
+    if not valid:
+        print(error)
+        return False
+    
+    out = None
+    try:
+        with open(path, "rb") as f:
+            # Validate the first chunk before printing anything, then stream the rest
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            chunk = f.read(1 << 20)
+            decoder.decode(chunk)
+            print(f"\n{ICONS['read']} Content of {path}:")
+            print("─" * 60)
+            if not chunk:
+                print("[Empty file]")
+                print("─" * 60)
+                return True
+            
+            sys.stdout.flush()
+            out = sys.stdout.buffer
+            while chunk:
+                out.write(chunk)
+                chunk = f.read(1 << 20)
+                decoder.decode(chunk, final=not chunk)
+            out.write(b"\n")
+            out.flush()
+        print("─" * 60)
+        return True
+    except UnicodeDecodeError:
+        if out is not None:
+            # Earlier chunks are already on screen; close the listing before reporting
+            out.flush()
+            print("\n" + "─" * 60)
+        print(f"{_ERROR} Could not read file - encoding error (not UTF-8)")
+        return False
+    except PermissionError:
+        print(f"{_ERROR} Permission denied - cannot read file: {path}")
+        return False
+    except IsADirectoryError:
+        print(f"{_ERROR} Path is a directory, not a file: {path}")
+        return False
+    except FileNotFoundError:
+        print(f"{_ERROR} File not found: {path}")
+        return False
+    except Exception as e:
+        print(f"{_ERROR} Could not read file: {str(e)}")
+        return False
+
+def write_file(path, text, append=False):
+    """Write or append to file with comprehensive error handling"""
+    valid, error, _ = validate_path(path, should_exist=append, path_type='file')
+    if not valid and append:
+        print(error)
+        return False
+    
+    try:
+        if not text or not isinstance(text, str):
+            print(f"{_WARNING} Warning: text input appears invalid, writing empty content")
+        
+        # For new files, ensure parent directory exists
+        path_obj = Path(path)
+        if not append:
+            _ensure_dir(path_obj.parent)
+        
+        icon = ICONS['append'] if append else ICONS['write']
+        
+        with Spinner("Writing to file"):
+            if append:
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(text + "\n")
+            else:
+                path_obj.write_text(text + "\n", encoding="utf-8")
+        
+        action = "Appended to" if append else "Written to"
+        print(f"{_SUCCESS} {icon} {action}: {path}")
+        check_suggest_compress(path)
+        return True
+    except PermissionError:
+        print(f"{_ERROR} Permission denied - cannot write to file")
+        return False
+    except IsADirectoryError:
+        print(f"{_ERROR} Path is a directory, not a file: {path}")
+        return False
+    except IOError as e:
+        print(f"{_ERROR} I/O error - could not write to file: {str(e)}")
+        return False
+    except Exception as e:
+        print(f"{_ERROR} Could not write to file: {str(e)}")
+        return False
+
+def rename_item(src, dst):
+    """Rename file or directory with comprehensive error handling"""
+    valid_src, error_src, _ = validate_path(src, should_exist=True)
+    if not valid_src:
+        print(error_src)
+        return False
+    
+    if not dst or not isinstance(dst, str):
+        print(f"{_ERROR} Destination path cannot be empty")
+        return False
+    
+    dst = dst.strip()
+    
+    try:
+        if Path(dst).exists():
+            print(f"{_ERROR} Destination already exists: {dst}")
+            return False
+        
+        with Spinner("Renaming"):
+            os.rename(src, dst)
+        print(f"{_SUCCESS} {ICONS['rename']} Renamed: {src} → {dst}")
+        return True
+    except PermissionError:
+        print(f"{_ERROR} Permission denied - cannot rename item")
+        return False
+    except FileExistsError:
+        print(f"{_ERROR} Destination already exists")
+        return False
+    except OSError as e:
+        print(f"{_ERROR} OS error during rename: {str(e)}")
+        return False
+    except Exception as e:
+        print(f"{_ERROR} Could not rename {src}: {e}")
+        return False
+
+def _walk_tree(path, ignore_errors=False):
+    """List what lies below path as (files, dirs), never following symlinks; dirs come children first"""
+    files, dirs = [], []
+    stack = [path]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        dirs.append(entry.path)
+                    else:
+                        files.append(entry.path)  # Symlinks included, so the link itself is removed
+        except OSError:
+            if not ignore_errors:
+                raise
+    # Every directory was listed after its parent, so reversing puts children first
+    dirs.reverse()
+    return files, dirs
+
+def _rmtree_fast(path, ignore_errors=False):
+    """Delete a directory tree bottom-up without following symlinks; with ignore_errors, delete what it can"""
+    import shutil
+    if _SYSTEM == "Windows":
+        # Junctions look like plain directories to DirEntry; shutil knows how to treat them
+        shutil.rmtree(path, ignore_errors=ignore_errors)
+        return
+    if os.path.islink(path):
+        raise OSError(f"Cannot delete a symbolic link as a directory tree: {path}")
+    
+    files, dirs = _walk_tree(path, ignore_errors)
+    dirs.append(path)
+    for remove, targets in ((os.unlink, files), (os.rmdir, dirs)):
+        for target in targets:
+            try:
+                remove(target)
+            except OSError:
+                if not ignore_errors:
+                    raise
+
+def delete_item(path):
+    """Delete file or directory with comprehensive error handling"""
+    valid, error, st = validate_path(path, should_exist=True)
+    if not valid:
+        print(error)
+        return False
+    
+    try:
+        if stat.S_ISDIR(st.st_mode):
+            with Spinner("Deleting"):
+                _rmtree_fast(path)
+        else:
+            with Spinner("Deleting"):
+                os.remove(path)
+        print(f"{_SUCCESS} {ICONS['delete']} Deleted: {path}")
+        return True
+    except PermissionError:
+        print(f"{_ERROR} Permission denied - cannot delete item")
+        return False
+    except OSError as e:
+        print(f"{_ERROR} OS error during delete: {str(e)}")
+        return False
+    except Exception as e:
+        print(f"{_ERROR} Could not delete {path}: {str(e)}")
+        return False
+
+def _copy_file(src, dst):
+    """Copy a file in kernel space with copy_file_range where available, then copy metadata"""
+    import shutil
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if not hasattr(os, "copy_file_range") or (os.path.exists(dst) and os.path.samefile(src, dst)):
+        shutil.copy2(src, dst)
+        return
+    
+    try:
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    except OSError:
+        # Unsupported filesystem or kernel; let shutil pick the best portable path
+        shutil.copy2(src, dst)
+        return
+    shutil.copystat(src, dst)
+
+def copy_item(src, dst):
+    """Copy file or directory with comprehensive error handling"""
+    import shutil
+    valid_src, error_src, src_st = validate_path(src, should_exist=True)
+    if not valid_src:
+        print(error_src)
+        return False
+    
+    if not dst or not isinstance(dst, str):
+        print(f"{_ERROR} Destination path cannot be empty")
+        return False
+    
+    dst = dst.strip()
+    
+    try:
+        # Create parent directory if needed
+        _ensure_dir(Path(dst).parent)
+        
+        if stat.S_ISDIR(src_st.st_mode):
+            if os.path.exists(dst):
+                print(f"{_WARNING} Destination exists, merging contents")
+            with Spinner("Copying"):
+                shutil.copytree(src, dst, dirs_exist_ok=True)
+        else:
+            with Spinner("Copying"):
+                _copy_file(src, dst)
+        print(f"{_SUCCESS} {ICONS['copy']} Copied: {src} → {dst}")
+        check_suggest_compress(dst)
+        return True
+    except PermissionError:
+        print(f"{_ERROR} Permission denied - cannot copy item")
+        return False
+    except FileNotFoundError:
+        print(f"{_ERROR} Source file not found: {src}")
+        return False
+    except IsADirectoryError:
+        print(f"{_ERROR} Destination is a directory, not a file")
+        return False
+    except OSError as e:
+        print(f"{_ERROR} OS error during copy: {str(e)}")
+        return False
+    except Exception as e:
+        print(f"{_ERROR} Could not copy {src}: {str(e)}")
+        return False
+
+def move_item(src, dst):
+    """Move file or directory with comprehensive error handling"""
+    import shutil
+    valid_src, error_src, _ = validate_path(src, should_exist=True)
+    if not valid_src:
+        print(error_src)
+        return False
+    
+    if not dst or not isinstance(dst, str):
+        print(f"{_ERROR} Destination path cannot be empty")
+        return False
+    
+    dst = dst.strip()
+    
+    try:
+        # Create parent directory if needed
+        _ensure_dir(Path(dst).parent)
+        
+        with Spinner("Moving"):
+            shutil.move(src, dst)
+        print(f"{_SUCCESS} {ICONS['move']} Moved: {src} → {dst}")
+        check_suggest_compress(dst)
+        return True
+    except PermissionError:
+        print(f"{_ERROR} Permission denied - cannot move item")
+        return False
+    except FileNotFoundError:
+        print(f"{_ERROR} Source not found: {src}")
+        return False
+    except OSError as e:
+        print(f"{_ERROR} OS error during move: {str(e)}")
+        return False
+    except Exception as e:
+        print(f"{_ERROR} Could not move {src}: {str(e)}")
+        return False
+
+def _scan_tree(directory, skipped=None):
+    """Yield a DirEntry for every file below directory without following symlinked dirs"""
+    stack = [directory]
+    while stack:
+        root = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except PermissionError:
+            if skipped is not None:
+                skipped.append(root)
+            continue
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+def _keyword_matcher(keyword):
+    """Build a thread-safe callable that tells whether a buffer contains keyword, ignoring case"""
+    if not keyword.isascii():
+        # Byte-level caseless matching only folds ASCII, so decode and casefold instead
+        kw_folded = keyword.casefold()
+        return lambda buf: kw_folded in buf[:].decode("utf-8", errors="ignore").casefold()
+    
+    try:
+        import hyperscan  # Optional: SIMD keyword matching
+    except ImportError:
+        hyperscan = None
+    
+    kw_bytes = re.escape(keyword.encode("utf-8"))
+    if hyperscan is not None:
+        try:
+            db = hyperscan.Database()
+            db.compile(expressions=[kw_bytes], flags=[hyperscan.HS_FLAG_CASELESS])
+        except hyperscan.error:
+            db = None
+        if db is not None:
+            local = threading.local()
+            
+            def hs_match(buf):
+                # Scratch space is per-thread in hyperscan
+                scratch = getattr(local, "scratch", None)
+                if scratch is None:
+                    scratch = local.scratch = hyperscan.Scratch(db)
+                found = []
+                
+                def on_match(*_):
+                    found.append(True)
+                    return 1  # Stop at the first hit
+                
+                try:
+                    db.scan(buf, match_event_handler=on_match, scratch=scratch)
+                except hyperscan.ScanTerminated:
+                    pass  # Raised when on_match stops the scan at the first hit
+                return bool(found)
+            return hs_match
+    
+    pattern = re.compile(kw_bytes, re.IGNORECASE)
+    return lambda buf: pattern.search(buf) is not None
+
+def _file_contains(file_path, match):
+    """Scan a file with a keyword matcher via mmap, skipping binary files"""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            return False
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        try:
+            if b"\0" in mm[:512]:
+                return False
+            return match(mm)
+        finally:
+            mm.close()
+    finally:
+        os.close(fd)
+
+# ------------------- SEARCH INDEX ------------------- #
+def _index_path():
+    """Location of the on-disk search index; RuntimeError if no home directory can be resolved"""
+    return Path.home() / ".cache" / "file_cli" / "index.db"
+
+# Paths are stored as os.fsencode() BLOBs so names that are not valid UTF-8 survive the round trip
+_INDEX_VERSION = 3
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files(path BLOB PRIMARY KEY, parent BLOB, name TEXT COLLATE NOCASE, ext TEXT);
+CREATE INDEX IF NOT EXISTS idx_files_parent ON files(parent);
+CREATE INDEX IF NOT EXISTS idx_files_name ON files(name);
+CREATE INDEX IF NOT EXISTS idx_files_ext ON files(ext);
+CREATE TABLE IF NOT EXISTS dirs(path BLOB PRIMARY KEY, parent BLOB, mtime_ns INTEGER, ctime_ns INTEGER);
+CREATE INDEX IF NOT EXISTS idx_dirs_parent ON dirs(parent);
+"""
+
+def _open_index():
+    """Open the on-disk search index, creating it on first use"""
+    import sqlite3
+    index_path = _index_path()
+    _ensure_dir(index_path.parent)
+    conn = sqlite3.connect(str(index_path))
+    if conn.execute("PRAGMA user_version").fetchone()[0] != _INDEX_VERSION:
+        # Index written by an older layout; start it over
+        conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS dirs;")
+        conn.execute(f"PRAGMA user_version = {_INDEX_VERSION}")
+    conn.executescript(_INDEX_SCHEMA)
+    return conn
+
+def _subtree_bounds(path):
+    """Return (lo, hi) such that lo <= p < hi selects every encoded path strictly below path"""
+    lo = os.fsencode(path.rstrip(os.sep) + os.sep)
+    return lo, lo[:-1] + bytes([lo[-1] + 1])
+
+def _parent_dir(path):
+    """Encoded parent directory of path for the index, or None for a filesystem root such as / or C:\\"""
+    parent = os.path.dirname(path)
+    return None if parent == path else os.fsencode(parent)
+
+def _like_escape(text):
+    """Escape LIKE wildcards so text matches literally"""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _refresh_index(conn, root, skipped):
+    """Bring the index up to date below root, rescanning only directories whose mtime or ctime changed"""
+    # Directories modified this recently could change again within the same mtime tick
+    racy_ns = time.time_ns() - 2 * 10**9
+    stack = [root]
+    with conn:
+        while stack:
+            d = stack.pop()
+            try:
+                st = os.stat(d)
+            except OSError:
+                continue
+            # mtime tracks entries added or removed; ctime also catches chmod, which can hide a directory
+            stamp = (st.st_mtime_ns, st.st_ctime_ns)
+            key = os.fsencode(d)
+            row = conn.execute("SELECT mtime_ns, ctime_ns FROM dirs WHERE path = ?", (key,)).fetchone()
+            if row == stamp:
+                stack.extend(os.fsdecode(p) for (p,) in
+                             conn.execute("SELECT path FROM dirs WHERE parent = ? AND path != parent", (key,)))
+                continue
+            
+            files, subdirs = [], []
+            try:
+                with os.scandir(d) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif entry.is_file():
+                                # The name column only feeds the SQL prefilter, so it can be lossy
+                                name = os.fsencode(entry.name).decode("utf-8", "replace")
+                                files.append((os.fsencode(entry.path), key, name, _extension(name)))
+                        except OSError:
+                            continue
+            except PermissionError:
+                skipped.append(d)
+                # Nothing below an unreadable directory may be reported, so drop what was indexed there
+                lo, hi = _subtree_bounds(d)
+                conn.execute("DELETE FROM files WHERE parent = ? OR (path >= ? AND path < ?)", (key, lo, hi))
+                conn.execute("DELETE FROM dirs WHERE path >= ? AND path < ?", (lo, hi))
+                conn.execute("INSERT OR REPLACE INTO dirs VALUES (?, ?, -1, -1)", (key, _parent_dir(d)))
+                continue
+            except OSError:
+                continue
+            
+            # Forget subdirectories that disappeared, along with everything below them
+            old = {os.fsdecode(p) for (p,) in
+                   conn.execute("SELECT path FROM dirs WHERE parent = ? AND path != parent", (key,))}
+            for gone in old.difference(subdirs):
+                lo, hi = _subtree_bounds(gone)
+                conn.execute("DELETE FROM files WHERE path >= ? AND path < ?", (lo, hi))
+                conn.execute("DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)",
+                             (os.fsencode(gone), lo, hi))
+            conn.execute("DELETE FROM files WHERE parent = ?", (key,))
+            conn.executemany("INSERT INTO files VALUES (?, ?, ?, ?)", files)
+            conn.execute("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?)",
+                         (key, _parent_dir(d)) + (stamp if max(stamp) < racy_ns else (-1, -1)))
+            stack.extend(reversed(subdirs))
+
+def _indexed_files(directory, skipped, name_l=None, ext_l=None):
+    """Return (path, name) pairs below directory from the index, pre-filtered in SQL where exact"""
+    root = os.path.abspath(directory)
+    lo, hi = _subtree_bounds(root)
+    sql = "SELECT path FROM files WHERE path >= ? AND path < ?"
+    params = [lo, hi]
+    # SQLite folds case for ASCII only, so non-ASCII filters are left to the caller
+    if name_l and name_l.isascii():
+        sql += " AND name LIKE ? ESCAPE '\\'"
+        params.append(f"%{_like_escape(name_l)}%")
+    if ext_l and ext_l.startswith(".") and ext_l.count(".") == 1:
+        sql += " AND (ext = ? OR name = ?)"
+        params += [ext_l, ext_l]
+    elif ext_l and ext_l.isascii():
+        sql += " AND name LIKE ? ESCAPE '\\'"
+        params.append(f"%{_like_escape(ext_l)}")
+    
+    conn = _open_index()
+    try:
+        _refresh_index(conn, root, skipped)
+        rows = conn.execute(sql + " ORDER BY path", params).fetchall()
+    finally:
+        conn.close()
+    
+    # Report paths relative to the directory as given, as a plain walk would
+    prefix = directory if directory.endswith(os.sep) else directory + os.sep
+    root_prefix = root.rstrip(os.sep) + os.sep
+    skipped[:] = [directory if d == root else prefix + d[len(root_prefix):] for d in skipped]
+    results = []
+    for (path,) in rows:
+        rel = os.fsdecode(path[len(lo):])
+        results.append((prefix + rel, os.path.basename(rel)))
+    return results
+
+def search_files(directory, name=None, ext=None, keyword=None):
+    """Search files with comprehensive error handling"""
+    import sqlite3
+    from concurrent.futures import ThreadPoolExecutor
+    valid, error, _ = validate_path(directory, should_exist=True, path_type='dir')
+    if not valid:
+        print(error)
+        return False
+
+    try:
+        if not os.access(directory, os.R_OK):
+            print(f"{_ERROR} Permission denied - cannot read directory: {directory}")
+            return False
+        
+        skipped = []
+        name_l = name.lower() if name else None
+        ext_l = ext.lower() if ext else None
+        kw_match = _keyword_matcher(keyword) if keyword else None
+        
+        def candidates():
+            # Cheap name/extension filters run before any file is opened
+            for file_path, fname in files:
+                fname = fname.lower()
+                if name_l and name_l not in fname:
+                    continue
+                if ext_l and not fname.endswith(ext_l):
+                    continue
+                yield file_path
+        
+        def check_keyword(file_path):
+            try:
+                return file_path if _file_contains(file_path, kw_match) else None
+            except (OSError, ValueError):
+                return None
+        
+        with Spinner("Searching files"):
+            try:
+                files = _indexed_files(directory, skipped, name_l, ext_l)
+            except (sqlite3.Error, OSError, RuntimeError):
+                # Index unavailable (e.g. read-only or no home directory); walk the tree instead
+                skipped.clear()
+                files = ((entry.path, entry.name) for entry in _scan_tree(directory, skipped))
+            
+            if kw_match:
+                workers = min(32, _NCPU * 4)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    matches = [p for p in executor.map(check_keyword, candidates()) if p]
+            else:
+                matches = list(candidates())
+        
+        for root in skipped:
+            print(f"{_WARNING} Skipped (permission denied): {root}")
+        # Emit hits in blocks of 1024 lines rather than one print per hit
+        prefix = ICONS['search'] + ' '
+        for i in range(0, len(matches), 1024):
+            sys.stdout.write(prefix + ('\n' + prefix).join(matches[i:i + 1024]) + '\n')
+        sys.stdout.flush()
+        
+        search_count = len(matches)
+        if not search_count:
+            print(f"{_INFO} No matching files found")
+        else:
+            print(f"{_INFO} Found {search_count} matching file(s)")
+        return True
+    except PermissionError:
+        print(f"{_ERROR} Permission denied - cannot access directory")
+        return False
+    except FileNotFoundError:
+        print(f"{_ERROR} Directory not found: {directory}")
+        return False
+    except Exception as e:
+        print(f"{_ERROR} Error during search: {str(e)}")
+        return False
+
+PARALLEL_ZIP_MIN_BYTES = 64 * 1024 * 1024  # Below this, worker start-up outweighs the gain
+
+def _zip_part(part_path, members):
+    """Worker: write one partial archive and return how many members it holds"""
+    import zipfile
+    count = 0
+    with zipfile.ZipFile(part_path, "w") as zf:
+        for path, arcname in members:
+            try:
+                _zip_write(zf, path, arcname)
+                count += 1
+            except OSError:
+                continue
+    return count
+
+def _partition_by_size(members, n):
+    """Split (path, arcname, size) members into at most n buckets of similar total size"""
+    buckets = [[] for _ in range(n)]
+    heap = [(0, i) for i in range(n)]
+    for path, arcname, size in sorted(members, key=lambda m: m[2], reverse=True):
+        total, i = heapq.heappop(heap)
+        buckets[i].append((path, arcname))
+        heapq.heappush(heap, (total + size, i))
+    return [b for b in buckets if b]
+
+# Raw merging writes into private ZipFile state: the archive handle `fp`, the central directory
+# entries in `filelist`/`NameToInfo`, and `start_dir`, where close() writes the directory
+_ZIP_INTERNALS = ("fp", "filelist", "NameToInfo", "start_dir")
+
+def _merge_part(zf, part_path):
+    """Append the compressed members of a partial archive to zf without recompressing them"""
+    import shutil
+    import zipfile
+    if not all(hasattr(zf, name) for name in _ZIP_INTERNALS):
+        # Internals changed in this Python; re-compress through the public API instead
+        with zipfile.ZipFile(part_path, "r") as part:
+            for info in part.infolist():
+                copy = zipfile.ZipInfo(info.filename, info.date_time)
+                copy.compress_type = info.compress_type
+                copy.external_attr = info.external_attr
+                copy.file_size = info.file_size
+                with part.open(info) as src, zf.open(copy, "w") as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+        return
+    
+    with zipfile.ZipFile(part_path, "r") as part, open(part_path, "rb") as fp:
+        infos = sorted(part.infolist(), key=lambda i: i.header_offset)
+        ends = [i.header_offset for i in infos[1:]] + [part.start_dir]
+        for info, end in zip(infos, ends):
+            # Copy the raw local header + data, then re-point the central directory entry
+            fp.seek(info.header_offset)
+            remaining = end - info.header_offset
+            info.header_offset = zf.fp.tell()
+            while remaining > 0:
+                chunk = fp.read(min(remaining, 1 << 20))
+                if not chunk:
+                    break
+                zf.fp.write(chunk)
+                remaining -= len(chunk)
+            zf.filelist.append(info)
+            zf.NameToInfo[info.filename] = info
+    zf.start_dir = zf.fp.tell()
+
+def _compress_parallel(members, dst, workers):
+    """Compress members on a process pool and merge the partial archives into dst"""
+    import multiprocessing
+    import tempfile
+    import zipfile
+    from concurrent.futures import ProcessPoolExecutor
+    buckets = _partition_by_size(members, workers)
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(dst))) as tmp:
+        parts = [os.path.join(tmp, f"part{i}.zip") for i in range(len(buckets))]
+        ctx = multiprocessing.get_context("spawn")  # The spinner thread makes fork unsafe
+        with ProcessPoolExecutor(max_workers=len(buckets), mp_context=ctx) as executor:
+            counts = list(executor.map(_zip_part, parts, buckets))
+        with zipfile.ZipFile(dst, "w") as zf:
+            for part in parts:
+                _merge_part(zf, part)
+    return sum(counts)
+
+@functools.lru_cache(maxsize=None)
+def _find_archiver():
+    """Return the path of a 7-Zip executable on PATH, or None"""
+    import shutil
+    for name in ("7zz", "7z", "7za"):
+        exe = shutil.which(name)
+        if exe:
+            return exe
+    return None
+
+def _compress_external(src, dst, src_is_dir):
+    """Build the archive with 7-Zip if installed; return the file count, or None to fall back"""
+    import subprocess
+    import zipfile
+    exe = _find_archiver()
+    if not exe:
+        return None
+    
+    # 7-Zip appends to existing archives, so build into a fresh file and swap it in
+    tmp_dst = f"{dst}.{os.getpid()}.tmp.zip"
+    # "dir/*" stores the directory contents without the "dir/" prefix, matching the native path
+    target = os.path.join(src, "*") if src_is_dir else src
+    cmd = [exe, "a", "-tzip", "-mx=1", "-mmt=on", "-bd", "-y", "--", tmp_dst, target]
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if result.returncode != 0:
+            return None
+        with zipfile.ZipFile(tmp_dst, "r") as zf:
+            file_count = sum(1 for info in zf.infolist() if not info.is_dir())
+        os.replace(tmp_dst, dst)
+        return file_count
+    except (OSError, zipfile.BadZipFile):
+        return None
+    finally:
+        if os.path.exists(tmp_dst):
+            os.remove(tmp_dst)
+
+def _compress_native(src, dst, src_is_dir, skipped):
+    """Build the archive with zipfile, in parallel for large directories"""
+    import zipfile
+    if not src_is_dir:
+        with zipfile.ZipFile(dst, "w", zipfile.ZIP_DEFLATED) as zf:
+            _zip_write(zf, src, os.path.basename(src))
+        return 1
+    
+    members = []
+    for entry in _scan_tree(src, skipped):
+        try:
+            members.append((entry.path, os.path.relpath(entry.path, src), entry.stat().st_size))
+        except OSError:
+            continue
+    
+    workers = min(_NCPU, len(members))
+    if workers > 1 and sum(m[2] for m in members) >= PARALLEL_ZIP_MIN_BYTES:
+        return _compress_parallel(members, dst, workers)
+    
+    file_count = 0
+    with zipfile.ZipFile(dst, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path, arcname, _ in members:
+            try:
+                _zip_write(zf, path, arcname)
+                file_count += 1
+            except (PermissionError, IOError):
+                continue
+    return file_count
+
+def compress_files(src, dst):
+    """Compress files with comprehensive error handling"""
+    import zipfile
+    valid_src, error_src, src_st = validate_path(src, should_exist=True)
+    if not valid_src:
+        print(error_src)
+        return False
+    
+    if not dst or not isinstance(dst, str):
+        print(f"{_ERROR} Destination path cannot be empty")
+        return False
+    
+    dst = dst.strip()
+    if not dst.lower().endswith('.zip'):
+        print(f"{_WARNING} Adding .zip extension to destination")
+        dst += '.zip'
+    
+    try:
+        # Create parent directory if needed
+        _ensure_dir(Path(dst).parent)
+        
+        # Check if destination already exists
+        if os.path.exists(dst):
+            print(f"{_WARNING} Archive already exists, will be overwritten: {dst}")
+        
+        skipped = []
+        
+        with Spinner("Compressing"):
+            src_is_dir = stat.S_ISDIR(src_st.st_mode)
+            file_count = _compress_external(src, dst, src_is_dir)
+            if file_count is None:
+                file_count = _compress_native(src, dst, src_is_dir, skipped)
+        
+        for root in skipped:
+            print(f"{_WARNING} Skipped (no permission): {root}")
+        
+        if file_count == 0:
+            print(f"{_WARNING} Source directory is empty or all files are inaccessible")
+            return False
+        
+        print(f"{_SUCCESS} {ICONS['compress']} Compressed {file_count} file(s): {src} → {dst}")
+        return True
+    except PermissionError:
+        print(f"{_ERROR} Permission denied - cannot create archive")
+        return False
+    except FileNotFoundError:
+        print(f"{_ERROR} Source not found: {src}")
+        return False
+    except zipfile.BadZipFile:
+        print(f"{_ERROR} Failed to create valid ZIP file")
+        return False
+    except OSError as e:
+        print(f"{_ERROR} OS error during compression: {str(e)}")
+        return False
+    except Exception as e:
+        print(f"{_ERROR} Could not compress {src}: {str(e)}")
+        return False
+
+def extract_zip(src, dst):
+    """Extract ZIP file with comprehensive error handling"""
+    import shutil
+    import zipfile
+    valid_src, error_src, _ = validate_path(src, should_exist=True, path_type='file')
+    if not valid_src:
+        print(error_src)
+        return False
+    
+    if not src.lower().endswith('.zip'):
+        print(f"{_ERROR} Source file is not a ZIP archive: {src}")
+        return False
+    
+    if not dst or not isinstance(dst, str):
+        print(f"{_ERROR} Destination path cannot be empty")
+        return False
+    
+    dst = dst.strip()
+
+    try:
+        # Create destination directory
+        _ensure_dir(dst)
+        
+        # Extract members one at a time; corruption surfaces as a CRC error while streaming
+        file_count = 0
+        unsafe = []
+        try:
+            dst_root = os.path.realpath(dst)
+            made = set()  # Directories already created by this extraction
+            with Spinner("Extracting"), zipfile.ZipFile(src, "r") as zf:
+                for info in zf.infolist():
+                    target = os.path.realpath(os.path.join(dst_root, info.filename))
+                    if os.path.commonpath([dst_root, target]) != dst_root:
+                        unsafe.append(info.filename)
+                        continue
+                    if info.is_dir():
+                        _ensure_dir(target, made)
+                        continue
+                    _ensure_dir(os.path.dirname(target), made)
+                    with zf.open(info) as member, open(target, "wb") as out:
+                        shutil.copyfileobj(member, out, 1 << 20)
+                    file_count += 1
+            
+            for name in unsafe:
+                print(f"{_WARNING} Skipped unsafe path outside destination: {name}")
+                
+        except zipfile.BadZipFile:
+            print(f"{_ERROR} Invalid or corrupted ZIP file: {src}")
+            return False
+        except zipfile.LargeZipFile:
+            print(f"{_ERROR} ZIP file is too large")
+            return False
+        
+        print(f"{_SUCCESS} {ICONS['extract']} Extracted {file_count} file(s): {src} → {dst}")
+        return True
+    except PermissionError:
+        print(f"{_ERROR} Permission denied - cannot extract archive")
+        return False
+    except FileNotFoundError:
+        print(f"{_ERROR} ZIP file not found: {src}")
+        return False
+    except IsADirectoryError:
+        print(f"{_ERROR} Source is a directory, not a ZIP file")
+        return False
+    except OSError as e:
+        print(f"{_ERROR} OS error during extraction: {str(e)}")
+        return False
+    except Exception as e:
+        print(f"{_ERROR} Could not extract {src}: {str(e)}")
+        return False
+
+def _fast_move(src, dst):
+    """Move with a single rename syscall, falling back to shutil.move across filesystems"""
+    import shutil
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+def organize_files(folder, dry_run=False, compress=False, compress_path=None):
+    """Organize files with comprehensive error handling"""
+    import zipfile
+    from datetime import datetime
+    from concurrent.futures import ThreadPoolExecutor
+    if not folder or not isinstance(folder, str):
+        print(f"{_ERROR} Folder path cannot be empty")
+        return False
+    
+    folder = folder.strip()
+    folder_path = Path(folder)
+    
+    try:
+        if not folder_path.exists():
+            print(f"{_ERROR} Folder does not exist: {folder}")
+            return False
+        
+        if not folder_path.is_dir():
+            print(f"{_ERROR} Path is not a directory: {folder}")
+            return False
+        
+        processed = []
+        print(f"\n{ICONS['organize']} Organizing files by type...\n")
+        
+        with os.scandir(folder) as it:
+            entries = list(it)
+        
+        # First pass: classify files and collect the categories they need
+        tasks = []
+        categories = set()
+        for entry in entries:
+            try:
+                if entry.is_file():
+                    category = _category_for(entry.name)
+                    tasks.append((entry, category))
+                    categories.add(category)
+            except (PermissionError, OSError) as e:
+                print(f"{_WARNING} Skipped: {str(e)}")
+                continue
+        
+        # Create each category folder exactly once
+        failed = set()
+        if not dry_run:
+            for category in categories:
+                try:
+                    (folder_path / category).mkdir(exist_ok=True)
+                except OSError:
+                    # Permission denied, or a regular file already holds the category name
+                    print(f"{_ERROR} Cannot create directory: {category}")
+                    failed.add(category)
+        
+        # Second pass: move files into place, overlapping rename latency on a thread pool
+        moves = [(entry, category, os.path.join(folder, category, entry.name))
+                 for entry, category in tasks if category not in failed]
+        if dry_run:
+            for entry, category, _ in moves:
+                print(f"{_INFO} [Dry-run] {entry.name} → {category}/")
+        else:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                futures = [executor.submit(_fast_move, entry.path, new_path) for entry, _, new_path in moves]
+            for (entry, category, new_path), future in zip(moves, futures):
+                error = future.exception()
+                if error is not None:
+                    print(f"{_ERROR} Could not move {entry.name}: {str(error)}")
+                    continue
+                processed.append(new_path)
+                print(f"{_SUCCESS} {ICONS['file']} {entry.name} → {category}/")
+                check_suggest_compress(new_path)
+
+        if compress and processed:
+            zip_dir = Path(compress_path) if compress_path else folder_path / "Compressed"
+            try:
+                zip_dir.mkdir(exist_ok=True)
+                zip_name = f"archive_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+                zip_path = zip_dir / zip_name
+                with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+                    for file in processed:
+                        _zip_write(zf, file, os.path.basename(file))
+                print(f"\n{_SUCCESS} {ICONS['compress']} Compressed {len(processed)} files into {zip_path}")
+            except PermissionError:
+                print(f"{_ERROR} Permission denied - cannot create archive")
+            except Exception as e:
+                print(f"{_ERROR} Error creating archive: {str(e)}")
+        
+        return True
+    except PermissionError:
+        print(f"{_ERROR} Permission denied - cannot access folder")
+        return False
+    except FileNotFoundError:
+        print(f"{_ERROR} Folder not found: {folder}")
+        return False
+    except Exception as e:
+        print(f"{_ERROR} Could not organize folder: {str(e)}")
+        return False
+
+# ------------------- STORAGE ANALYSIS ------------------- #
+_CLEANUP_WORKERS = min(32, _NCPU * 4)
+# Every possible 20-cell usage bar, indexed by filled cells (one per 5%)
+_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+_UNLINK_CHUNK = 256
+
+def _safe_unlink(path):
+    """Remove a file, returning 1 on success and 0 if it could not be removed"""
+    try:
+        os.unlink(path)
+        return 1
+    except OSError:
+        return 0
+
+def _unlink_chunk(paths):
+    """Worker: unlink a slice of paths and return how many were removed"""
+    return sum(map(_safe_unlink, paths))
+
+def _safe_rmtree(path):
+    """Remove a directory tree, returning 1 if it is gone afterwards and 0 otherwise"""
+    _rmtree_fast(path, ignore_errors=True)
+    return 0 if os.path.lexists(path) else 1
+
+def _rmdir_quiet(path):
+    """Remove an emptied directory, returning 1 on success and 0 if it could not be removed"""
+    try:
+        os.rmdir(path)
+        return 1
+    except OSError:
+        return 0  # Still holds something we could not delete
+
+_URING_BATCH = 512
+
+def _uring_unlink_all(paths):
+    """Unlink paths through io_uring in batches, returning how many were removed"""
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    liburing.io_uring_queue_init(_URING_BATCH * 2, ring)
+    removed = 0
+    try:
+        for start in range(0, len(paths), _URING_BATCH):
+            batch = paths[start:start + _URING_BATCH]
+            for path in batch:
+                liburing.io_uring_prep_unlink(liburing.io_uring_get_sqe(ring), path)
+            # One submit-and-wait per batch instead of a syscall per file
+            liburing.io_uring_submit_and_wait(ring, len(batch))
+            pending = len(batch)
+            while pending:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                ready = liburing.io_uring_cq_ready(ring)
+                for i in range(ready):
+                    try:
+                        cqe[i].res  # Raises for a failed unlink
+                        removed += 1
+                    except OSError:
+                        pass
+                liburing.io_uring_cq_advance(ring, ready)
+                pending -= ready
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return removed
+
+def _unlink_all(paths, executor):
+    """Unlink paths through io_uring when available, else in chunks on executor; return the count"""
+    removed = 0
+    if paths and liburing is not None and sys.platform == "linux":
+        # The binding only takes str paths it can encode as UTF-8; the pool handles the rest
+        encodable, rest = [], []
+        for path in paths:
+            try:
+                path.encode()
+                encodable.append(path)
+            except UnicodeEncodeError:
+                rest.append(path)
+        try:
+            removed = _uring_unlink_all(encodable) if encodable else 0
+            paths = rest
+        except (OSError, ValueError, TypeError):
+            pass  # Kernel without io_uring (or it is disabled), use the thread pool
+    # ThreadPoolExecutor.map ignores chunksize, so slice the paths up front to amortise dispatch
+    chunks = [paths[i:i + _UNLINK_CHUNK] for i in range(0, len(paths), _UNLINK_CHUNK)]
+    return removed + sum(executor.map(_unlink_chunk, chunks))
+
+def _clean_temp_dir(temp_dir):
+    """Delete everything under temp_dir and return how many top-level entries were removed"""
+    from concurrent.futures import ThreadPoolExecutor
+    try:
+        with os.scandir(temp_dir) as it:
+            entries = list(it)
+    except OSError:
+        return 0
+    
+    files, dirs = [], []
+    for entry in entries:
+        try:
+            if entry.is_symlink():
+                files.append(entry.path)  # Unlink the link itself, never what it points at
+            elif entry.is_dir(follow_symlinks=False):
+                dirs.append(entry.path)
+            else:
+                files.append(entry.path)
+        except OSError:
+            continue
+    
+    with ThreadPoolExecutor(max_workers=_CLEANUP_WORKERS) as executor:
+        if _SYSTEM == "Windows":
+            # _rmtree_fast defers to shutil there, so hand it whole subtrees
+            removed_dirs = executor.map(_safe_rmtree, dirs)
+            return _unlink_all(files, executor) + sum(removed_dirs)
+        
+        # Pull every nested file into the same parallel unlink pass as the top-level ones
+        nested, subdirs = [], []
+        walk = functools.partial(_walk_tree, ignore_errors=True)
+        for tree_files, tree_dirs in executor.map(walk, dirs):
+            nested.extend(tree_files)
+            subdirs.extend(tree_dirs)
+        removed = _unlink_all(files, executor)
+        _unlink_all(nested, executor)
+    
+    # Each directory is empty by now (children first), so one rmdir apiece finishes the job
+    for path in subdirs:
+        _rmdir_quiet(path)
+    return removed + sum(map(_rmdir_quiet, dirs))
+
+def _list_drives():
+    """Return the root of every mounted drive"""
+    if _SYSTEM == "Windows":
+        import ctypes
+        # One bitmask call instead of probing each letter, which can spin up removable media
+        mask = ctypes.windll.kernel32.GetLogicalDrives()
+        return [f"{d}:/" for i, d in enumerate(_DRIVE_LETTERS) if mask & (1 << i)]
+    return ["/"]
+
+def _safe_disk_usage(drive):
+    """Return the disk usage of a drive, or the exception raised while probing it"""
+    import shutil
+    try:
+        return shutil.disk_usage(drive)
+    except Exception as e:
+        return e
+
+def storage_analysis():
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+    print(f"\n{ICONS['storage']} === Storage Analysis ===\n")
+
+    drives = _list_drives()
+
+    print(f"{_INFO} Scanning drives...\n")
+    # Probe every drive at once so a slow or empty removable drive only delays itself
+    with ThreadPoolExecutor(max_workers=max(1, len(drives))) as executor:
+        usages = list(executor.map(_safe_disk_usage, drives))
+    for d, usage in zip(drives, usages):
+        if isinstance(usage, Exception):
+            print(f"{_ERROR} Could not access {d}: {usage}")
+            continue
+        total = usage.total >> 30
+        used = usage.used >> 30
+        usage_percent = (used / total * 100) if total > 0 else 0
+        bar = _BARS[min(int(usage_percent) // 5, 20)]
+        print(f"{ICONS['folder']} Drive {d:<4} │ [{bar}] {usage_percent:>5.1f}% │ {used:>4}/{total:>4} GB")
+
+    temp_dir = tempfile.gettempdir()
+    print(f"\n{ICONS['temp']} Temporary files location: {temp_dir}")
+    choice = input(f"{_INFO} Delete all temporary files? (yes/no): ").strip().lower()
+    if choice == "yes":
+        try:
+            with Spinner("Cleaning temp files"):
+                deleted_count = _clean_temp_dir(temp_dir)
+            print(f"{_SUCCESS} {ICONS['temp']} Cleaned {deleted_count} temporary items")
+        except Exception as e:
+            print(f"{_ERROR} Could not delete temp files: {e}")
+    else:
+        print(f"{_INFO} Temp files not deleted.")
+
+# ------------------- SUGGEST COMPRESSION ------------------- #
+def check_suggest_compress(path, threshold_mb=50):
+    """Suggest compressing file if larger than threshold"""
+    try:
+        # One stat gives both the file type and the size
+        st = os.stat(path)
+    except OSError:
+        return
+    if stat.S_ISREG(st.st_mode) and st.st_size > threshold_mb * 1024 * 1024:
+        size_mb = st.st_size / (1024 * 1024)
+        print(f"{_WARNING} {ICONS['compress']} File {path} is {size_mb:.1f} MB. Consider compressing it!")
+
+# ------------------- INTERACTIVE MENU ------------------- #
+# The banner never changes, so it is formatted once at import and written in one call
+_MENU = "\n".join([
+    "\n" + "=" * 60,
+    f"{ICONS['file']} File Operations Menu",
+    "=" * 60,
+    f"{ICONS['create']}  1) Create File",
+    f"{ICONS['read']}  2) Read File",
+    f"{ICONS['write']}  3) Write File",
+    f"{ICONS['append']}  4) Append File",
+    f"{ICONS['rename']}  5) Rename File/Folder",
+    f"{ICONS['delete']}  6) Delete File/Folder",
+    f"{ICONS['copy']}  7) Copy File/Folder",
+    f"{ICONS['move']}  8) Move File/Folder",
+    f"{ICONS['search']}  9) Search Files",
+    f"{ICONS['compress']} 10) Compress",
+    f"{ICONS['extract']} 11) Extract",
+    f"{ICONS['organize']} 12) Organize Folder",
+    f"{ICONS['storage']} 13) Storage Analysis & Temp Cleanup",
+    "🚪 0) Exit",
+    "=" * 60,
+]) + "\n"
+
+def menu_mode():
+    import importlib
+    # Loading readline (pyreadline3 on Windows) gives every input() below line editing and history
+    for module in ("readline", "pyreadline3"):
+        try:
+            importlib.import_module(module)
+            break
+        except ImportError:
+            continue
+    
+    # The banner is shown once; "?" brings it back instead of redrawing it after every action
+    sys.stdout.write(_MENU)
+    sys.stdout.flush()
+    while True:
+        try:
+            choice = input(f"\n{_INFO} Choose option (? for menu): ").strip()
+
+            if choice == "?":
+                sys.stdout.write(_MENU)
+                sys.stdout.flush()
+            elif choice == "1":
+                path = input(f"{ICONS['create']} Enter file path: ").strip()
+                if path:
+                    create_file(path)
+                else:
+                    print(f"{_ERROR} File path cannot be empty")
+            elif choice == "2":
+                path = input(f"{ICONS['read']} Enter file path: ").strip()
+                if path:
+                    read_file(path)
+                else:
+                    print(f"{_ERROR} File path cannot be empty")
+            elif choice == "3":
+                path = input(f"{ICONS['write']} Enter file path: ").strip()
+                if path:
+                    text = input(f"{ICONS['write']} Enter text: ")
+                    write_file(path, text, append=False)
+                else:
+                    print(f"{_ERROR} File path cannot be empty")
+            elif choice == "4":
+                path = input(f"{ICONS['append']} Enter file path: ").strip()
+                if path:
+                    text = input(f"{ICONS['append']} Enter text: ")
+                    write_file(path, text, append=True)
+                else:
+                    print(f"{_ERROR} File path cannot be empty")
+            elif choice == "5":
+                src = input(f"{ICONS['rename']} Enter source path: ").strip()
+                dst = input(f"{ICONS['rename']} Enter destination path: ").strip()
+                if src and dst:
+                    rename_item(src, dst)
+                else:
+                    print(f"{_ERROR} Both source and destination paths are required")
+            elif choice == "6":
+                path = input(f"{ICONS['delete']} Enter path: ").strip()
+                if path:
+                    if input(f"{_WARNING} Are you sure? (yes/no): ").lower() == 'yes':
+                        delete_item(path)
+                    else:
+                        print(f"{_INFO} Delete cancelled")
+                else:
+                    print(f"{_ERROR} Path cannot be empty")
+            elif choice == "7":
+                src = input(f"{ICONS['copy']} Enter source path: ").strip()
+                dst = input(f"{ICONS['copy']} Enter destination path: ").strip()
+                if src and dst:
+                    copy_item(src, dst)
+                else:
+                    print(f"{_ERROR} Both source and destination paths are required")
+            elif choice == "8":
+                src = input(f"{ICONS['move']} Enter source path: ").strip()
+                dst = input(f"{ICONS['move']} Enter destination path: ").strip()
+                if src and dst:
+                    move_item(src, dst)
+                else:
+                    print(f"{_ERROR} Both source and destination paths are required")
+            elif choice == "9":
+                directory = input(f"{ICONS['search']} Enter directory: ").strip()
+                if directory:
+                    search_files(
+                        directory,
+                        name=input(f"{ICONS['search']} Name (optional): ").strip() or None,
+                        ext=input(f"{ICONS['search']} Extension (optional, e.g. .txt): ").strip() or None,
+                        keyword=input(f"{ICONS['search']} Keyword (optional): ").strip() or None
+                    )
+                else:
+                    print(f"{_ERROR} Directory path cannot be empty")
+            elif choice == "10":
+                src = input(f"{ICONS['compress']} Enter source path: ").strip()
+                dst = input(f"{ICONS['compress']} Enter destination .zip path: ").strip()
+                if src and dst:
+                    if not dst.lower().endswith('.zip'):
+                        dst += '.zip'
+                    compress_files(src, dst)
+                else:
+                    print(f"{_ERROR} Both source and destination paths are required")
+            elif choice == "11":
+                src = input(f"{ICONS['extract']} Enter .zip path: ").strip()
+                dst = input(f"{ICONS['extract']} Enter destination folder: ").strip()
+                if src and dst:
+                    extract_zip(src, dst)
+                else:
+                    print(f"{_ERROR} Both source and destination paths are required")
+            elif choice == "12":
+                path = input(f"{ICONS['organize']} Enter folder path: ").strip()
+                if path:
+                    organize_files(path)
+                else:
+                    print(f"{_ERROR} Folder path cannot be empty")
+            elif choice == "13":
+                storage_analysis()
+            elif choice == "0":
+                print(f"\n{_SUCCESS} Goodbye 👋\n")
+                break
+            else:
+                print(f"{_ERROR} Invalid choice.")
+                
+        except KeyboardInterrupt:
+            print(f"\n{_INFO} Operation cancelled")
+            continue
+        except Exception as e:
+            print(f"{_ERROR} An error occurred: {str(e)}")
+
+# ------------------- CLI ------------------- #
+# Subcommand -> (number of positional arguments, handler)
+_COMMANDS = {
+    "menu": (0, lambda a: menu_mode()),
+    "storage": (0, lambda a: storage_analysis()),
+    "compress": (2, lambda a: compress_files(a[0], a[1])),
+    "extract": (2, lambda a: extract_zip(a[0], a[1])),
+}
+
+def _build_parser():
+    """Full argparse parser, only built for --help and malformed command lines"""
+    import argparse
+    parser = argparse.ArgumentParser(description="File Operations CLI Tool")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # menu
+    subparsers.add_parser("menu", help="Run interactive menu")
+
+    # storage
+    subparsers.add_parser("storage", help="Run storage analysis and temp cleanup")
+
+    # compress
+    sp_compress = subparsers.add_parser("compress", help="Compress files/folders")
+    sp_compress.add_argument("src")
+    sp_compress.add_argument("dst")
+
+    # extract
+    sp_extract = subparsers.add_parser("extract", help="Extract zip file")
+    sp_extract.add_argument("src")
+    sp_extract.add_argument("dst")
+
+    return parser
+
+def main():
+    # Block-buffer stdout instead of flushing every line; input() and the spinner flush when needed
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if reconfigure is not None:
+        reconfigure(line_buffering=False, write_through=False)
+    
+    argv = sys.argv[1:]
+    command = _COMMANDS.get(argv[0]) if argv else None
+    rest = argv[1:]
+    
+    # Well-formed invocations dispatch directly; anything with options goes through argparse
+    if command is not None and len(rest) == command[0] and not any(a.startswith("-") for a in rest):
+        command[1](rest)
+        return
+    
+    args = _build_parser().parse_args(argv)
+    _COMMANDS[args.command][1]([getattr(args, "src", None), getattr(args, "dst", None)])
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print(f"\n{_INFO} Cancelled by user.")
         sys.exit(1)
\ No newline at end of file